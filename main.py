@@ -6,7 +6,7 @@ from scripts.plot_images import PlotImages
 if __name__ == '__main__':
     settings = Settings().add_options()
     f = GeotagImages(settings)
-    f.apply()
+    df = f.apply()
     if settings.generate_map == 'yes':
         f = PlotImages(settings)
-        f.apply()
+        f.apply(df)
@@ -1,3 +1,4 @@
+import pandas as pd
 from scripts.tagging_functions import GeotaggingFunctions, Logging
 from timezonefinder import TimezoneFinder
 
@@ -15,6 +16,12 @@ class GeotagImages:
         self.tz = TimezoneFinder()
 
     def apply(self):
+        """
+        Geotags all images in the input location and returns the results of the matching as a pandas dataframe, so
+        that later steps (such as PlotImages) do not have to read the exif data of the images again.
+
+        :return: a pandas dataframe containing: path, filename, datetime, latitude, longitude, timediff, status
+        """
         self.logger.log_info('Geotagging Images Started')
         self.logger.log_info('The input location = {0}'.format(self.input_location))
         image_list = self.gf.retrieve_image_filelist(self.input_location)
@@ -32,5 +39,9 @@ class GeotagImages:
             latitude, longitude, altitude, speed, satellites, gpstime = gpx[list(gpx.keys())[0]]
             timezone = self.tz.timezone_at(lng=float(longitude), lat=float(latitude))
             self.logger.log_info('{0} points loaded from the GPX file'.format(len(gpx)))
-            for entry in image_list:
-                self.gf.geotag_image(entry, self.correction, gpx, timezone)
+            results = [self.gf.geotag_image(entry, self.correction, gpx, timezone) for entry in image_list]
+            df = pd.DataFrame(results, columns=['path', 'filename', 'datetime', 'latitude', 'longitude', 'timediff',
+                                                'status'])
+            self.logger.log_info('{0} of {1} images were matched to the GPX trace'
+                                 .format((df['status'] == 'matched').sum(), len(df)))
+            return df
@@ -21,8 +21,20 @@ class PlotImages:
         # Setup coordinate conversion parameters:
         self.transformer = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
 
-    def apply(self):
-        df = self.exif_coordinates_to_dataframe(self.input_location)
+    def apply(self, df=None):
+        """
+        Creates the map of the images. If a dataframe as returned by GeotagImages.apply() is given, it is used directly,
+        otherwise the coordinates are read from the exif data of the images in the input location.
+        Images that could not be matched (and thus have no coordinates) are left out of the map.
+
+        :param df: optional pandas dataframe containing: path, filename, datetime, latitude, longitude, status
+        """
+        if df is None:
+            df = self.exif_coordinates_to_dataframe(self.input_location)
+        df = df[df['status'] == 'matched'].reset_index(drop=True)
+        if df.empty:
+            self.logger.log_warning('No geotagged images found, no map is generated')
+            return
         df = self.add_3857_to_df(df)
         self.create_bokeh_plot(df)
 
@@ -34,20 +46,29 @@ class PlotImages:
         dataframe.
 
         :param input_location: the directory containing the images to extract the exif data from.
-        :return: a pandas dataframe containing: path, filename, datetime, latitude, longitude
+        Images without GPS data get the status 'unmatched' and no coordinates.
+
+        :return: a pandas dataframe containing: path, filename, datetime, latitude, longitude, status
         """
         image_list = self.gf.retrieve_image_filelist(input_location)
-        paths, filenames, dates, lats, lons = [], [], [], [], []
+        paths, filenames, dates, lats, lons, statuses = [], [], [], [], [], []
         for file in image_list:
             exif_dict = piexif.load(file)
             # Extract the datetime from the exif data, transform byte to string and create a datetime object from it:
             img_datetime = self.gf.string_to_datetime(
                 self.gf.decode_byte_object(exif_dict["0th"][piexif.ImageIFD.DateTime]))
-            latitude, longitude = self.gf.dms_to_decimal_degrees((exif_dict["GPS"][piexif.GPSIFD.GPSLatitude],
-                                                                  exif_dict["GPS"][piexif.GPSIFD.GPSLongitude]))
+            gps = exif_dict.get("GPS", {})
+            if piexif.GPSIFD.GPSLatitude in gps and piexif.GPSIFD.GPSLongitude in gps:
+                latitude, longitude = self.gf.dms_to_decimal_degrees((gps[piexif.GPSIFD.GPSLatitude],
+                                                                      gps[piexif.GPSIFD.GPSLongitude]))
+                status = 'matched'
+            else:
+                latitude, longitude = None, None
+                status = 'unmatched'
             dates.append(img_datetime)
             lats.append(latitude)
             lons.append(longitude)
+            statuses.append(status)
             filenames.append(file.split('/')[-1])
             paths.append(file)
         df = pd.DataFrame()
@@ -56,6 +77,7 @@ class PlotImages:
         df['datetime'] = dates
         df['latitude'] = lats
         df['longitude'] = lons
+        df['status'] = statuses
 
         return df
 
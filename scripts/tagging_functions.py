@@ -306,6 +306,17 @@ class GeotaggingFunctions:
         return exif_dict
 
     def geotag_image(self, image_location, correction, gpx_dict, timezone):
+        """
+        This function matches the image to the GPX trace and, if a match within 5 minutes is found, writes the
+        coordinates to the exif data of the image. It returns the result of the match so that it can be used further
+        (for example for plotting) without reading the exif data of the image again.
+
+        :param image_location: full path to the image
+        :param correction: timedelta object used to correct the image datetime
+        :param gpx_dict: a gpx dictionary with the gpx datetime as key (as generated by gpx_to_dictionary())
+        :param timezone: the timezone in which the image was taken
+        :return: dictionary containing: path, filename, datetime, latitude, longitude, timediff, status
+        """
         exif_dict = piexif.load(image_location)
         # Extract the datetime from the exif data, transform byte to string and create a datetime object from it:
         img_datetime = self.string_to_datetime(
@@ -321,8 +332,17 @@ class GeotaggingFunctions:
         utc_datetime = datetime.strptime(utc_datetime.strftime("%Y:%m:%d %H:%M:%S"), "%Y:%m:%d %H:%M:%S")
         # Match datetime to the GPX trace using the utc_time:
         min_datetime, min_timediff = self.match_to_gpx(gpx_dict, utc_datetime)
+        result = {
+            'path': image_location,
+            'filename': os.path.basename(image_location),
+            'datetime': corrected_datetime,
+            'latitude': None,
+            'longitude': None,
+            'timediff': min_timediff,
+            'status': 'unmatched'
+        }
         # If a match was found, add the data to the image:
-        if min_timediff < 300:  # less than 5 minutes difference
+        if min_timediff is not None and min_timediff < 300:  # less than 5 minutes difference
             latitude, longitude, altitude, speed, satellites, gpstime = gpx_dict[min_datetime]
             # Set coordinates in exif data:
             exif_dict = self.add_gps_to_exif(exif_dict, latitude, longitude, altitude, gpstime, satellites)
@@ -331,6 +351,13 @@ class GeotaggingFunctions:
             piexif.insert(exif_bytes, image_location)  # write to image, will overwrite exif data in original file
             self.logger.log_info('Image {} was matched and a coordinate has been added to the exif data'
                                  .format(image_location))
+            result['latitude'] = float(latitude)
+            result['longitude'] = float(longitude)
+            result['status'] = 'matched'
+        else:
+            self.logger.log_info('Image {} could not be matched to the GPX trace'.format(image_location))
+
+        return result
 
     def decimal_degrees_to_dms(self, decimal_degrees):
         """